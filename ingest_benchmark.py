@@ -13,7 +13,7 @@ Outputs `ingest_times.csv` with four rows:
   mongo_sales,<t>
 
 Dependencies:
-    pip install psycopg2-binary pymongo tqdm
+    pip install psycopg2-binary pymongo tqdm ijson orjson
 
 Containers (via docker-compose.yml):
     postgres 16 exposed on 5432
@@ -24,15 +24,25 @@ from __future__ import annotations
 
 import os
 import time
+import atexit
 import csv
-import json
-from io import StringIO
+import functools
+import re
+import struct
+from datetime import datetime, timezone
+from decimal import Decimal
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, StringIO
 from pathlib import Path
 from typing import Iterable, List
 
+import ijson
+import orjson
 import psycopg2
 from psycopg2 import sql
+from psycopg2.extras import execute_batch, execute_values
 from pymongo import MongoClient
+from pymongo.write_concern import WriteConcern
 from tqdm import tqdm
 
 # ---------------------------------------------------------------------------
@@ -47,16 +57,31 @@ PG_DB_SQL   = os.getenv("PG_DB", "commerce")          # baseline DB
 PG_DB_JSON  = "commerce_sql_json"                       # new DB for JSON ingest
 
 MONGO_URI   = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+MONGO_W     = int(os.getenv("MONGO_W", 0))                # 0 = unacknowledged bulk load
+MONGO_CHUNK = 10000       # docs per insert_many batch
+# pymongo refuses bypass_document_validation on unacknowledged (w=0) writes
+MONGO_BULK_OPTS = {"ordered": False, "bypass_document_validation": MONGO_W != 0}
 
 CURRENT_DIR = Path(__file__).parent
 
-SQL_FILE    = CURRENT_DIR / "sql/commerce_load.sql"     # full DDL + INSERTs
-DDL_FILE    = CURRENT_DIR / "sql/commerce_schema.sql"    # pure DDL only
+SQL_FILE    = CURRENT_DIR / "sql/commerce_load.sql"     # full DDL + COPY blocks
+DDL_FILE    = CURRENT_DIR / "sql/commerce_schema_base.sql"         # tables only
+CONSTRAINTS_FILE = CURRENT_DIR / "sql/commerce_schema_constraints.sql"  # PK/FK/indices, after load
 CATALOG_JSON= CURRENT_DIR / "json/stores_catalog.json"
 SALES_JSON  = CURRENT_DIR / "json/sales_docs.json"
 OUT_CSV     = CURRENT_DIR / "ingest_times.csv"
 
 BATCH_SIZE  = 1000        # rows per batch INSERT / COPY
+# "copy" streams COPY data as-is; "insert" falls back to batched INSERTs
+# (execute_values for the SQL script, execute_batch for the JSON load) for
+# setups where COPY FROM STDIN is not available
+PG_LOAD_METHOD = os.getenv("PG_LOAD_METHOD", "copy")
+if PG_LOAD_METHOD not in ("copy", "insert"):
+    raise ValueError(f"PG_LOAD_METHOD must be 'copy' or 'insert', got {PG_LOAD_METHOD!r}")
+TQDM_MINITERS = 500       # redraw progress bars at most every N items
+
+# bulk-load session tuning: don't wait for the WAL flush at COMMIT
+PG_BULK_SETTINGS = "SET LOCAL synchronous_commit TO OFF;\n"
 
 # ---------------------------------------------------------------------------
 # UTILITIES
@@ -64,6 +89,8 @@ BATCH_SIZE  = 1000        # rows per batch INSERT / COPY
 
 def timed(label: str):
     def decorator(fn):
+        # wraps() keeps the module-level name so workers can pickle the task
+        @functools.wraps(fn)
         def wrapper(*args, **kwargs):
             print(f"\n▶ {label} …")
             t0 = time.perf_counter()
@@ -74,30 +101,176 @@ def timed(label: str):
         return wrapper
     return decorator
 
+# binary COPY encoders ------------------------------------------------------
+# https://www.postgresql.org/docs/16/sql-copy.html#id-1.9.3.55.9.4
+PGCOPY_HEADER  = b"PGCOPY\n\xff\r\n\0" + struct.pack("!ii", 0, 0)
+PGCOPY_TRAILER = struct.pack("!h", -1)
+PG_EPOCH       = datetime(2000, 1, 1)
+
+def encode_int4(v: int) -> bytes:
+    return struct.pack("!ii", 4, v)
+
+
+def encode_text(v: str) -> bytes:
+    payload = v.encode("utf-8")
+    return struct.pack("!i", len(payload)) + payload
+
+
+def encode_timestamp(v: datetime) -> bytes:
+    """timestamp without time zone = µs since 2000-01-01 as int64."""
+    delta = v - PG_EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack("!iq", 8, micros)
+
+
+def encode_numeric(v) -> bytes:
+    """numeric wire format: ndigits, weight, sign, dscale + base‑10000 digits."""
+    sign, digits, exp = Decimal(str(v)).as_tuple()
+    dscale = max(-exp, 0)
+    num = "".join(map(str, digits))
+    if exp >= 0:
+        int_part, frac_part = num + "0" * exp, ""
+    else:
+        num = num.rjust(-exp, "0")
+        int_part, frac_part = num[:exp] or "0", num[exp:]
+    int_part = int_part.rjust(-(-len(int_part) // 4) * 4, "0")
+    frac_part = frac_part.ljust(-(-len(frac_part) // 4) * 4, "0")
+    groups = [int(int_part[i:i+4]) for i in range(0, len(int_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(frac_part[i:i+4]) for i in range(0, len(frac_part), 4)]
+    while groups and groups[0] == 0:
+        groups.pop(0); weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+    payload = struct.pack(f"!hhHh{len(groups)}H", len(groups), weight,
+                          0x4000 if sign else 0x0000, dscale, *groups)
+    return struct.pack("!i", len(payload)) + payload
+
+
+# column layout of every table loaded from JSON, in COPY order; the encoder
+# is picked once per column instead of type-sniffing every value
+PG_COPY_TABLES = {
+    "store":     [("store_id", encode_int4), ("name", encode_text), ("address", encode_text)],
+    "employee":  [("employee_id", encode_int4), ("first_name", encode_text), ("last_name", encode_text),
+                  ("position", encode_text), ("store_id", encode_int4)],
+    "category":  [("category_id", encode_int4), ("name", encode_text)],
+    "product":   [("product_id", encode_int4), ("name", encode_text), ("price", encode_numeric),
+                  ("category_id", encode_int4)],
+    "inventory": [("store_id", encode_int4), ("product_id", encode_int4), ("quantity", encode_int4)],
+    "customer":  [("customer_id", encode_int4), ("first_name", encode_text), ("last_name", encode_text),
+                  ("email", encode_text)],
+    "sale":      [("sale_id", encode_int4), ("sale_timestamp", encode_timestamp), ("customer_id", encode_int4),
+                  ("store_id", encode_int4), ("employee_id", encode_int4), ("total_amount", encode_numeric)],
+    "saleline":  [("sale_id", encode_int4), ("line_number", encode_int4), ("product_id", encode_int4),
+                  ("quantity", encode_int4), ("unit_price", encode_numeric), ("line_total", encode_numeric)],
+}
+
+# shared connections ---------------------------------------------------------
+# one psycopg2 connection per (port, db) and one MongoClient per process,
+# closed at interpreter exit (pool workers drop theirs when they terminate)
+_PG_CONNS: dict[tuple[int, str], "psycopg2.extensions.connection"] = {}
+_MONGO: MongoClient | None = None
+
+def pg_connect(port: int, dbname: str):
+    conn = _PG_CONNS.get((port, dbname))
+    if conn is None or conn.closed:
+        conn = _PG_CONNS[(port, dbname)] = psycopg2.connect(
+            host=PG_HOST, port=port, user=PG_USER, password=PG_PASSWORD, dbname=dbname)
+    return conn
+
+
+def mongo_client() -> MongoClient:
+    global _MONGO
+    if _MONGO is None:
+        _MONGO = MongoClient(MONGO_URI, maxPoolSize=8)
+    return _MONGO
+
+
+@atexit.register
+def close_connections():
+    for conn in _PG_CONNS.values():
+        conn.close()
+    _PG_CONNS.clear()
+    if _MONGO is not None:
+        _MONGO.close()
+
 # small helper to COPY from memory -----------------------------------------
 
-def copy_rows(cur, table: str, columns: List[str], rows: Iterable[Iterable]):
-    if not rows:
-        return
-    
-    buffer = StringIO()
-    for row in rows:
-        buffer.write("\t".join(str(v) for v in row) + "\n")
+def copy_rows(cur, table: str, columns: List[str], buffer: BytesIO):
+    """Finish a binary COPY *buffer* and stream it into *table* in one go."""
+    buffer.write(PGCOPY_TRAILER)
     buffer.seek(0)
     cols = sql.SQL(',').join(map(sql.Identifier, columns))
     # force lower‑case to match unquoted DDL table names
-    cur.copy_expert(sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT text)")
+    cur.copy_expert(sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)")
                     .format(sql.Identifier(table.lower()), cols), buffer)
 
+def insert_rows(cur, table: str, columns: List[str], rows: List[tuple]):
+    """Row-wise fallback to copy_rows: parameterised INSERTs sent in pages
+    of BATCH_SIZE via execute_batch."""
+    cols = sql.SQL(',').join(map(sql.Identifier, columns))
+    values = sql.SQL(',').join(sql.Placeholder() * len(columns))
+    stmt = (sql.SQL("INSERT INTO {} ({}) VALUES ({})")
+            .format(sql.Identifier(table.lower()), cols, values))
+    execute_batch(cur, stmt, rows, page_size=BATCH_SIZE)
+
+# psql-style "COPY … FROM STDIN;" header; its data runs until a "\." line
+COPY_STDIN_RE = re.compile(r"^COPY\s+(\S+)\s*(?:\(([^)]*)\))?\s+FROM\s+STDIN\b.*;[ \t]*$",
+                           re.IGNORECASE | re.MULTILINE)
+COPY_END      = "\n\\.\n"
+COPY_UNESC_RE = re.compile(r"\\(.)")
+COPY_UNESC    = {"t": "\t", "n": "\n", "r": "\r"}
+
+def parse_copy_field(field: str):
+    """Inverse of COPY text-format escaping; \\N is NULL."""
+    if field == "\\N":
+        return None
+    if "\\" not in field:
+        return field
+    return COPY_UNESC_RE.sub(lambda m: COPY_UNESC.get(m.group(1), m.group(1)), field)
+
+
+def insert_copy_data(cur, table: str, columns: str | None, data: str):
+    """Replay a COPY text block as batched INSERTs via execute_values."""
+    # split on "\n" only: COPY escapes \n/\r but not other Unicode line breaks
+    rows = [[parse_copy_field(v) for v in line.split("\t")] for line in data.split("\n") if line]
+    if not rows:
+        return
+    target = f"{table} ({columns})" if columns else table
+    execute_values(cur, f"INSERT INTO {target} VALUES %s", rows, page_size=BATCH_SIZE)
+
+
+def run_sql_script(cur, script: str, method: str = PG_LOAD_METHOD):
+    """Execute a psql-style script: plain SQL through execute(), inline
+    COPY … FROM STDIN blocks through copy_expert() (or execute_values()
+    when *method* is "insert")."""
+    if method not in ("copy", "insert"):
+        raise ValueError(f"method must be 'copy' or 'insert', got {method!r}")
+    pos = 0
+    while (m := COPY_STDIN_RE.search(script, pos)) is not None:
+        if script[pos:m.start()].strip():
+            cur.execute(script[pos:m.start()])
+        end = script.index(COPY_END, m.end())
+        data = script[m.end() + 1:end + 1]
+        if method == "insert":
+            insert_copy_data(cur, m.group(1), m.group(2), data)
+        else:
+            cur.copy_expert(m.group(0), StringIO(data))
+        pos = end + len(COPY_END)
+    if script[pos:].strip():
+        cur.execute(script[pos:])
+
 # ---------------------------------------------------------------------------
 # POSTGRES BASELINE (SQL file)
 # ---------------------------------------------------------------------------
 @timed("PostgreSQL load - SQL script")
 def load_postgres_sql():
-    with psycopg2.connect(host=PG_HOST, port=PG_PORT, user=PG_USER, password=PG_PASSWORD, dbname=PG_DB_SQL) as conn:
+    with pg_connect(PG_PORT, PG_DB_SQL) as conn:
         conn.autocommit = False
         with conn.cursor() as cur:
-            cur.execute(SQL_FILE.read_text())
+            run_sql_script(cur, PG_BULK_SETTINGS + SQL_FILE.read_text())
         conn.commit()
 
 # ---------------------------------------------------------------------------
@@ -105,136 +278,158 @@ def load_postgres_sql():
 # ---------------------------------------------------------------------------
 @timed("PostgreSQL load – JSON")
 def load_postgres_from_json():
-    # 1. connect to new DB and create schema
-    with psycopg2.connect(host=PG_HOST, port=PG_PORT_JSON, user=PG_USER, password=PG_PASSWORD, dbname=PG_DB_JSON) as conn:
+    # 1. connect to new DB and create bare tables; keys, FKs and indices are
+    #    added after the COPYs so rows don't pay per-row checks/index updates
+    with pg_connect(PG_PORT_JSON, PG_DB_JSON) as conn:
         conn.autocommit = False
         with conn.cursor() as cur:
+            cur.execute(PG_BULK_SETTINGS)
             cur.execute(DDL_FILE.read_text())
 
-            # --- ingest catalog JSON ---
-            catalog = json.loads(CATALOG_JSON.read_text())
-
+            # per-table COPY buffers, filled while walking the JSON and
+            # flushed with a single COPY per table at the end
+            # (with PG_LOAD_METHOD=insert rows are kept as tuples instead and
+            # sent through execute_batch)
+            buffers: dict[str, BytesIO] = {}
+            pending: dict[str, List[tuple]] = {}
+            use_copy = PG_LOAD_METHOD != "insert"
+            row_prefix = {t: struct.pack("!h", len(spec)) for t, spec in PG_COPY_TABLES.items()}
+            encoders = {t: [enc for _, enc in spec] for t, spec in PG_COPY_TABLES.items()}
+
+            def append_row(table: str, row: Iterable):
+                if not use_copy:
+                    pending.setdefault(table, []).append(tuple(row))
+                    return
+                buf = buffers.get(table)
+                if buf is None:
+                    buf = buffers[table] = BytesIO()
+                    buf.write(PGCOPY_HEADER)
+                buf.write(row_prefix[table] + b"".join([enc(v) for enc, v in zip(encoders[table], row)]))
+
+            # --- ingest catalog JSON (streamed one store at a time) ---
             category_map, product_map, store_map, employee_map = {}, {}, {}, {}
             next_cat = next_prod = next_emp = 1
 
-            for store_doc in catalog:
-                s_id = len(store_map) + 1
-                store_map[store_doc["store_name"]] = s_id
-                copy_rows(cur, "store", ["store_id", "name", "address"],
-                          [(s_id, store_doc["store_name"], store_doc.get("address", ""))])
-
-                for emp in store_doc.get("employees", []):
-                    eid = next_emp; next_emp += 1
-                    employee_map[(emp["first_name"], emp["last_name"], s_id)] = eid
-                    copy_rows(cur, "employee", ["employee_id", "first_name", "last_name", "position", "store_id"],
-                              [(eid, emp["first_name"], emp["last_name"], emp.get("position", ""), s_id)])
-
-                for inv in store_doc.get("inventory", []):
-                    prod = inv["product"]
-                    cat_name = prod["category"]
-                    if cat_name not in category_map:
-                        category_map[cat_name] = next_cat; next_cat += 1
-                        copy_rows(cur, "category", ["category_id", "name"],
-                                  [(category_map[cat_name], cat_name)])
-
-                    if prod["name"] not in product_map:
-                        pid = next_prod; next_prod += 1
-                        product_map[prod["name"]] = pid
-                        copy_rows(cur, "product", ["product_id", "name", "price", "category_id"],
-                                  [(pid, prod["name"], prod["price"], category_map[cat_name])])
-
-                    copy_rows(cur, "inventory", ["store_id", "product_id", "quantity"],
-                              [(s_id, product_map[prod["name"]], inv["quantity"])])
+            with CATALOG_JSON.open("rb") as f:
+                for store_doc in ijson.items(f, "item"):
+                    s_id = len(store_map) + 1
+                    store_map[store_doc["store_name"]] = s_id
+                    append_row("store", (s_id, store_doc["store_name"], store_doc.get("address", "")))
+
+                    for emp in store_doc.get("employees", []):
+                        eid = next_emp; next_emp += 1
+                        employee_map[(emp["first_name"], emp["last_name"], s_id)] = eid
+                        append_row("employee", (eid, emp["first_name"], emp["last_name"], emp.get("position", ""), s_id))
+
+                    for inv in store_doc.get("inventory", []):
+                        prod = inv["product"]
+                        cat_name = prod["category"]
+                        if cat_name not in category_map:
+                            category_map[cat_name] = next_cat; next_cat += 1
+                            append_row("category", (category_map[cat_name], cat_name))
+
+                        if prod["name"] not in product_map:
+                            pid = next_prod; next_prod += 1
+                            product_map[prod["name"]] = pid
+                            append_row("product", (pid, prod["name"], prod["price"], category_map[cat_name]))
+
+                        append_row("inventory", (s_id, product_map[prod["name"]], inv["quantity"]))
 
             # Sales
             customers_map = {}
             next_cust = next_sale = 1
 
-            sales_docs = json.loads(SALES_JSON.read_text())
-
             def extract_ts(ts):
-                """Return plain ISO‑8601 string acceptable to Postgres."""
+                """Return a naive UTC datetime from Extended-JSON or plain ISO‑8601."""
                 if isinstance(ts, dict) and "$date" in ts:
-                    return ts["$date"].replace("Z", "")  # keep ISO, drop Z for simplicity
-                return ts  # already string
+                    ts = ts["$date"]
+                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                if dt.tzinfo is not None:  # column is timestamp without time zone
+                    dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+                return dt
             
-            for sale in tqdm(sales_docs, desc="sales json -> pg"):
-                cust_email = sale["customer"]["email"]
-                if cust_email not in customers_map:
-                    cid = next_cust; next_cust += 1
-                    customers_map[cust_email] = cid
-                    c = sale["customer"]
-                    copy_rows(cur, "customer", ["customer_id", "first_name", "last_name", "email"],
-                              [(cid, c["first_name"], c["last_name"], c["email"])])
-
-                store_id = store_map[sale["store"]["name"]]
-                emp_key = (sale["employee"]["first_name"], sale["employee"]["last_name"], store_id)
-                employee_id = employee_map[emp_key]
-
-                sale_id = next_sale; next_sale += 1
-                ts_value = extract_ts(sale["timestamp"])
-                copy_rows(cur, "sale", ["sale_id", "sale_timestamp", "customer_id", "store_id", "employee_id", "total_amount"],
-                          [(sale_id, ts_value, customers_map[cust_email], store_id, employee_id, sale["total_amount"])])
-
-                line_no = 1
-                for ln in sale["lines"]:
-                    prod_id = product_map.get(ln["product"]["name"])
-                    if prod_id is None:
-                        #print(f"Product {ln['product']['name']} not found")
-                        continue
-                    copy_rows(cur, "saleline", ["sale_id", "line_number", "product_id", "quantity", "unit_price", "line_total"],
-                              [(sale_id, line_no, prod_id, ln["quantity"], ln["product"]["price"], ln["line_total"])])
-                    line_no += 1
+            with SALES_JSON.open("rb") as f:
+                for sale in tqdm(ijson.items(f, "item"), desc="sales json -> pg",
+                                 miniters=TQDM_MINITERS, mininterval=0.2):
+                    cust_email = sale["customer"]["email"]
+                    if cust_email not in customers_map:
+                        cid = next_cust; next_cust += 1
+                        customers_map[cust_email] = cid
+                        c = sale["customer"]
+                        append_row("customer", (cid, c["first_name"], c["last_name"], c["email"]))
+
+                    store_id = store_map[sale["store"]["name"]]
+                    emp_key = (sale["employee"]["first_name"], sale["employee"]["last_name"], store_id)
+                    employee_id = employee_map[emp_key]
+
+                    sale_id = next_sale; next_sale += 1
+                    ts_value = extract_ts(sale["timestamp"])
+                    append_row("sale", (sale_id, ts_value, customers_map[cust_email], store_id, employee_id, sale["total_amount"]))
+
+                    line_no = 1
+                    for ln in sale["lines"]:
+                        prod_id = product_map.get(ln["product"]["name"])
+                        if prod_id is None:
+                            #print(f"Product {ln['product']['name']} not found")
+                            continue
+                        append_row("saleline", (sale_id, line_no, prod_id, ln["quantity"], ln["product"]["price"], ln["line_total"]))
+                        line_no += 1
+
+            # one COPY per table, then build keys/indices and validate FKs
+            for table, buf in buffers.items():
+                copy_rows(cur, table, [c for c, _ in PG_COPY_TABLES[table]], buf)
+            for table, rows in pending.items():
+                insert_rows(cur, table, [c for c, _ in PG_COPY_TABLES[table]], rows)
+            cur.execute(CONSTRAINTS_FILE.read_text())
 
         conn.commit()
 
 # ---------------------------------------------------------------------------
 # MONGO INGEST
 # ---------------------------------------------------------------------------
+def bulk_collection(client: MongoClient, name: str):
+    """Drop *name* (acknowledged) and return it with the bulk-load write concern."""
+    db = client["commerce"]
+    db[name].drop()
+    return db.get_collection(name, write_concern=WriteConcern(w=MONGO_W, j=False))
+
 @timed("MongoDB load - catalog")
 def load_mongo_catalog():
-    client = MongoClient(MONGO_URI)
-    db = client["commerce"]
-    coll = db["stores"]
-    coll.drop()
-    docs = json.loads(CATALOG_JSON.read_text())
-    coll.insert_many(docs)
-    client.close()
+    coll = bulk_collection(mongo_client(), "stores")
+    docs = orjson.loads(CATALOG_JSON.read_bytes())
+    coll.insert_many(docs, **MONGO_BULK_OPTS)
 
 @timed("MongoDB load – sales")
 def load_mongo_sales():
-    client = MongoClient(MONGO_URI)
-    db = client["commerce"]
-    coll = db["sales"]
-    coll.drop()
-    docs = json.loads(SALES_JSON.read_text())
-    CHUNK = 2000
-    for chunk in tqdm([docs[i:i+CHUNK] for i in range(0, len(docs), CHUNK)], desc="mongo sales batches"):
-        coll.insert_many(chunk)
-    client.close()
+    coll = bulk_collection(mongo_client(), "sales")
+    docs = orjson.loads(SALES_JSON.read_bytes())
+    for i in tqdm(range(0, len(docs), MONGO_CHUNK), desc="mongo sales batches"):
+        coll.insert_many(docs[i:i+MONGO_CHUNK], **MONGO_BULK_OPTS)
+
+def load_mongo():
+    """Catalog then sales in the same process, sharing one MongoClient."""
+    dt_cat, _ = load_mongo_catalog()
+    dt_sales, _ = load_mongo_sales()
+    return [("mongo_catalog", dt_cat), ("mongo_sales", dt_sales)]
 
 # ---------------------------------------------------------------------------
 # MAIN
 # ---------------------------------------------------------------------------
 
 def main():
-    results = []
-
-    # 1. baseline SQL
-    dt_pg_sql, _ = load_postgres_sql()
-    results.append(("postgres_sql", dt_pg_sql))
-
-    # 2. JSON → Postgres
-    dt_pg_json, _ = load_postgres_from_json()
-    results.append(("postgres_json", dt_pg_json))
-
-    # 3. Mongo catalog & sales
-    dt_cat, _ = load_mongo_catalog()
-    dt_sales, _ = load_mongo_sales()
-    results.extend([
-        ("mongo_catalog", dt_cat),
-        ("mongo_sales", dt_sales),
-    ])
+    # the loads hit independent servers (pg :5432, pg :5433, mongo), so run
+    # them side by side; processes rather than threads because the JSON →
+    # Postgres path spends its time in Python encoding the COPY payload.
+    # Both Mongo steps stay in one worker so they share its client.
+    with ProcessPoolExecutor(max_workers=3) as ex:
+        pg_sql  = ex.submit(load_postgres_sql)
+        pg_json = ex.submit(load_postgres_from_json)
+        mongo   = ex.submit(load_mongo)
+        results = [
+            ("postgres_sql", pg_sql.result()[0]),
+            ("postgres_json", pg_json.result()[0]),
+            *mongo.result(),
+        ]
 
     with OUT_CSV.open("w", newline="") as f:
         writer = csv.writer(f)
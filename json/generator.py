@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import random
 import itertools
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import numpy as np
+import orjson
 from faker import Faker
+from faker.exceptions import UniquenessException
 from faker.providers import person, address, company, date_time
 from jsonschema import Draft202012Validator
 
@@ -23,6 +24,8 @@ MAX_LINES  = 10
 RANDOM_SEED = 42
 START_DATE  = datetime(2023, 5, 23)
 END_DATE    = datetime(2025, 5, 22)
+DRAW_RETRIES = 20  # rejection rounds for distinct products per sale
+NAME_POOL   = 300  # first/last names drawn from Faker up front (may repeat)
 
 DATA_DIR = Path(__file__).parent
 
@@ -31,9 +34,13 @@ SALES_FILE   = DATA_DIR / "sales_docs.json"
 CAT_SCHEMA   = DATA_DIR / "stores_catalog_schema.json"
 SALE_SCHEMA  = DATA_DIR / "sales_docs_schema.json"
 
+if MAX_LINES > PRODUCTS:
+    raise ValueError(f"MAX_LINES ({MAX_LINES}) cannot exceed PRODUCTS ({PRODUCTS})")
+
 # ----------------------------------------------------------------------------------
 random.seed(RANDOM_SEED)
 np.random.seed(RANDOM_SEED)
+rng = np.random.default_rng(RANDOM_SEED)
 
 fake = Faker("es_MX")
 Faker.seed(RANDOM_SEED)
@@ -59,25 +66,56 @@ def chunks(iterable, size):
         yield batch
 
 
-def rand_dt() -> datetime:
-    delta = END_DATE - START_DATE
-    return START_DATE + timedelta(seconds=random.randint(0, int(delta.total_seconds())))
+def unique_pool(factory, n, max_retries=1000):
+    """Call *factory* until it has produced *n* distinct values (first-seen order).
+
+    Like ``fake.unique``, give up after *max_retries* consecutive repeats.
+    """
+    seen = {}
+    misses = 0
+    while len(seen) < n:
+        value = factory()
+        if value in seen:
+            misses += 1
+            if misses > max_retries:
+                raise UniquenessException(
+                    f"got only {len(seen)} distinct values of {n} after {max_retries} retries")
+            continue
+        seen[value] = None
+        misses = 0
+    return list(seen)
+
+
+def has_dup_lines(draw, mask):
+    """Per row of *draw*, whether the slots selected by *mask* repeat a value."""
+    # unused slots get distinct negative sentinels so they never collide
+    filled = np.sort(np.where(mask, draw, -1 - np.arange(draw.shape[1])), axis=1)
+    return (filled[:, 1:] == filled[:, :-1]).any(axis=1)
 
 # ----------------------------- CATALOG GENERATION ---------------------------------
 print("▶ Generating catalog data …")
 
-categories = [(i + 1, fake.unique.word().title()) for i in range(CATEGORIES)]
+categories = [(i + 1, w.title()) for i, w in enumerate(fake.words(nb=CATEGORIES, unique=True))]
+product_names = unique_pool(fake.catch_phrase, PRODUCTS)
 
 products = [
     {
         "product_id": i + 1,
-        "name": fake.unique.catch_phrase(),
+        "name": product_names[i],
         "price": round(random.uniform(5, 1000), 2),
         "category_id": random.choice(categories)[0],
     }
     for i in range(PRODUCTS)
 ]
 
+# embedded view of each product (parallel to `products`); inventory entries and
+# sale lines hold a reference to it instead of re-looking it up by id
+cat_by_id = {cid: cname for cid, cname in categories}
+product_docs = [
+    {"name": p["name"], "category": cat_by_id[p["category_id"]], "price": p["price"]}
+    for p in products
+]
+
 stores = [
     {
         "store_id": i + 1,
@@ -87,12 +125,17 @@ stores = [
     for i in range(STORES)
 ]
 
+# name pools shared by employees and customers; picking from a list avoids
+# going through Faker's provider dispatch for every person
+first_names = [fake.first_name() for _ in range(NAME_POOL)]
+last_names  = [fake.last_name() for _ in range(NAME_POOL)]
+
 positions = ["Cajero", "Vendedor", "Gerente"]
 employees = [
     {
         "employee_id": i + 1,
-        "first_name": fake.first_name(),
-        "last_name": fake.last_name(),
+        "first_name": random.choice(first_names),
+        "last_name": random.choice(last_names),
         "position": random.choice(positions),
         "store_id": (i + 1) % STORES + 1,
     }
@@ -102,9 +145,9 @@ employees = [
 customers = [
     {
         "customer_id": i + 1,
-        "first_name": fake.first_name(),
-        "last_name": fake.last_name(),
-        "email": fake.email(),
+        "first_name": random.choice(first_names),
+        "last_name": random.choice(last_names),
+        "email": fake.email(),  # kept per customer: the PG loader keys customers by email
     }
     for i in range(CUSTOMERS)
 ]
@@ -112,11 +155,11 @@ customers = [
 # Inventory: ≈50% of products per store
 inventory = []
 for st in stores:
-    sample = random.sample(products, k=PRODUCTS // 2)
-    for prod in sample:
+    sample = random.sample(range(PRODUCTS), k=PRODUCTS // 2)
+    for k in sample:
         inventory.append({
             "store_id": st["store_id"],
-            "product_id": prod["product_id"],
+            "product_ref": product_docs[k],
             "quantity": random.randint(0, 200),
         })
 
@@ -126,73 +169,83 @@ print("▶ Generating sales data …")
 from numpy.random import zipf
 zipf_ids = zipf(a=2.0, size=SALES) % CUSTOMERS
 
-sales_hdr  = []
-sale_lines = []
-
-for sale_id in range(1, SALES + 1):
-    st  = random.choice(stores)
-    emp = random.choice([e for e in employees if e["store_id"] == st["store_id"]])
-    cust= customers[zipf_ids[sale_id - 1]]
-
-    n_lines = random.randint(MIN_LINES, MAX_LINES)
-    chosen  = random.sample(products, k=n_lines)
-
-    total = 0.0
-    for line_num, prod in enumerate(chosen, start=1):
-        qty        = random.randint(1, 5)
-        line_total = round(prod["price"] * qty, 2)
-        sale_lines.append({
-            "sale_id": sale_id,
-            "line_number": line_num,
-            "product_id": prod["product_id"],
-            "quantity": qty,
-            "unit_price": prod["price"],
-            "line_total": line_total,
+# store → employees / inventory, built once instead of filtering per sale/store
+emps_by_store: dict[int, list] = {}
+for e in employees:
+    emps_by_store.setdefault(e["store_id"], []).append(e)
+inv_by_store: dict[int, list] = {}
+for inv in inventory:
+    inv_by_store.setdefault(inv["store_id"], []).append(inv)
+
+# draw every random number for all sales up front, then assemble the dicts
+store_idx = rng.integers(0, STORES, SALES)
+n_lines   = rng.integers(MIN_LINES, MAX_LINES + 1, SALES)
+# distinct products per sale: draw MAX_LINES ids per row and redraw only the
+# rows whose first n_lines repeat a product
+line_mask = np.arange(MAX_LINES) < n_lines[:, None]
+prod_draw = rng.integers(0, PRODUCTS, (SALES, MAX_LINES))
+bad = np.flatnonzero(has_dup_lines(prod_draw, line_mask))
+for _ in range(DRAW_RETRIES):
+    if not bad.size:
+        break
+    prod_draw[bad] = rng.integers(0, PRODUCTS, (bad.size, MAX_LINES))
+    bad = bad[has_dup_lines(prod_draw[bad], line_mask[bad])]
+for row in bad:  # rare stragglers (n_lines close to PRODUCTS): sample directly
+    prod_draw[row] = rng.choice(PRODUCTS, MAX_LINES, replace=False)
+prod_idx  = prod_draw[line_mask]
+qty       = rng.integers(1, 6, prod_idx.size)
+prices    = np.array([p["price"] for p in products], dtype=np.float64)
+line_tot  = np.round(prices[prod_idx] * qty, 2)
+bounds    = np.concatenate(([0], n_lines.cumsum()))
+totals    = np.round(np.add.reduceat(line_tot, bounds[:-1]), 2)
+ts_secs   = rng.integers(0, int((END_DATE - START_DATE).total_seconds()) + 1, SALES)
+
+# back to plain Python scalars so orjson can serialise them
+store_idx, bounds, totals, ts_secs = store_idx.tolist(), bounds.tolist(), totals.tolist(), ts_secs.tolist()
+prod_idx, qty, line_tot = prod_idx.tolist(), qty.tolist(), line_tot.tolist()
+
+# each sale document is emitted complete, lines embedded, in a single pass
+sale_docs = []
+
+for i in range(SALES):
+    st  = stores[store_idx[i]]
+    emp = random.choice(emps_by_store[st["store_id"]])
+    cust= customers[zipf_ids[i]]
+
+    embedded_lines = []
+    for j in range(bounds[i], bounds[i + 1]):
+        embedded_lines.append({
+            "product": product_docs[prod_idx[j]],
+            "quantity": qty[j],
+            "line_total": line_tot[j],
         })
-        total += line_total
-
-    sales_hdr.append({
-        "sale_id": sale_id,
-        "timestamp": rand_dt(),
-        "customer_id": cust["customer_id"],
-        "store_id": st["store_id"],
-        "employee_id": emp["employee_id"],
-        "total_amount": round(total, 2),
+
+    sale_docs.append({
+        "timestamp": mongo_date(START_DATE + timedelta(seconds=ts_secs[i])),
+        "store":    {"name": st["name"]},
+        "employee": {"first_name": emp["first_name"], "last_name": emp["last_name"]},
+        "customer": {"first_name": cust["first_name"], "last_name": cust["last_name"], "email": cust["email"]},
+        "lines": embedded_lines,
+        "total_amount": totals[i],
     })
 
 # ----------------------------- BUILD DOCUMENTS ------------------------------------
 print("▶ Building JSON documents …")
 
-cat_by_id  = {cid: cname for cid, cname in categories}
-prod_by_id = {p["product_id"]: p for p in products}
-emp_by_id  = {e["employee_id"]: e for e in employees}
-store_by_id= {s["store_id"]: s for s in stores}
-cust_by_id = {c["customer_id"]: c for c in customers}
-
-# group sale lines by sale_id for fast access
-lines_by_sale = {}
-for line in sale_lines:
-    lines_by_sale.setdefault(line["sale_id"], []).append(line)
-
 # 1️⃣ catalog docs (stores)
 store_docs = []
 for st in stores:
     inv_embedded = []
-    for inv in (i for i in inventory if i["store_id"] == st["store_id"]):
-        pr = prod_by_id[inv["product_id"]]
+    for inv in inv_by_store.get(st["store_id"], []):
         inv_embedded.append({
-            "product": {
-                "name": pr["name"],
-                "category": cat_by_id[pr["category_id"]],
-                "price": pr["price"],
-            },
+            "product": inv["product_ref"],
             "quantity": inv["quantity"],
         })
     emp_embedded = [{
         "first_name": e["first_name"],
         "last_name":  e["last_name"],
         "position":   e["position"],
-    } for e in employees if e["store_id"] == st["store_id"]]
+    } for e in emps_by_store.get(st["store_id"], [])]
 
     store_docs.append({
         "store_name": st["name"],
@@ -201,35 +254,6 @@ for st in stores:
         "inventory": inv_embedded,
     })
 
-# 2️⃣ sales docs (transactions)
-sale_docs = []
-for sh in sales_hdr:
-    st  = store_by_id[sh["store_id"]]
-    emp = emp_by_id[sh["employee_id"]]
-    cust= cust_by_id[sh["customer_id"]]
-
-    embedded_lines = []
-    for ln in lines_by_sale[sh["sale_id"]]:
-        pr = prod_by_id[ln["product_id"]]
-        embedded_lines.append({
-            "product": {
-                "name": pr["name"],
-                "category": cat_by_id[pr["category_id"]],
-                "price": pr["price"],
-            },
-            "quantity": ln["quantity"],
-            "line_total": ln["line_total"],
-        })
-
-    sale_docs.append({
-        "timestamp": mongo_date(sh["timestamp"]),
-        "store":    {"name": st["name"]},
-        "employee": {"first_name": emp["first_name"], "last_name": emp["last_name"]},
-        "customer": {"first_name": cust["first_name"], "last_name": cust["last_name"], "email": cust["email"]},
-        "lines": embedded_lines,
-        "total_amount": sh["total_amount"],
-    })
-
 # ----------------------------- SCHEMA (OPTIONAL) ----------------------------------
 # print("▶ Building JSON Schema …")
 
@@ -269,10 +293,10 @@ for sh in sales_hdr:
 
 # ----------------------------- WRITE FILES ----------------------------------------
 print("▶ Writing files …")
-CATALOG_FILE.write_text(json.dumps(store_docs, ensure_ascii=False, indent=2))
-SALES_FILE.write_text(json.dumps(sale_docs, ensure_ascii=False, indent=2))
-# CAT_SCHEMA.write_text(json.dumps(catalog_schema, indent=2))
-# SALE_SCHEMA.write_text(json.dumps(sales_schema, indent=2))
+CATALOG_FILE.write_bytes(orjson.dumps(store_docs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+SALES_FILE.write_bytes(orjson.dumps(sale_docs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+# CAT_SCHEMA.write_bytes(orjson.dumps(catalog_schema, option=orjson.OPT_INDENT_2))
+# SALE_SCHEMA.write_bytes(orjson.dumps(sales_schema, option=orjson.OPT_INDENT_2))
 
 # # quick validation on first doc of each collection
 # Draft202012Validator(catalog_schema).validate(store_docs[:1])